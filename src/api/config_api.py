@@ -11,7 +11,6 @@ To change settings, edit .env or docker-compose.yml and restart the stack.
 
 from typing import Any
 
-import httpx
 from fastapi import APIRouter
 from pydantic import BaseModel
 
@@ -21,6 +20,7 @@ from ..services.credentials_service import (
     get_llm_credentials,
     get_embedder_credentials,
 )
+from ..services.model_check_service import REACHABLE_STATUSES, check_model_availability
 
 router = APIRouter()
 
@@ -79,57 +79,19 @@ async def _check_model_availability(
     """Check model availability at an API endpoint.
 
     Returns dict with reachable, model_available, available_models, error.
+    Shares the cached check used by the dashboard status endpoint.
     """
-    if not api_url:
-        return {
-            "reachable": False,
-            "model_available": False,
-            "available_models": [],
-            "error": "API URL not configured",
-        }
-
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            headers = {}
-            if api_key:
-                headers["Authorization"] = f"Bearer {api_key}"
-            response = await client.get(f"{api_url}/models", headers=headers)
-            reachable = response.status_code == 200
-            if reachable:
-                data = response.json()
-                models = data.get("data", [])
-                available_models = [m.get("id", "") for m in models]
-                model_available = any(
-                    model == mid or mid.startswith(f"{model}:")
-                    for mid in available_models
-                )
-                error = None if model_available else f"Model '{model}' not found in available models"
-                return {
-                    "reachable": True,
-                    "model_available": model_available,
-                    "available_models": available_models,
-                    "error": error,
-                }
-            return {
-                "reachable": False,
-                "model_available": False,
-                "available_models": [],
-                "error": f"HTTP {response.status_code}",
-            }
-    except httpx.TimeoutException:
-        return {
-            "reachable": False,
-            "model_available": False,
-            "available_models": [],
-            "error": "Connection timeout",
-        }
-    except Exception as e:
-        return {
-            "reachable": False,
-            "model_available": False,
-            "available_models": [],
-            "error": str(e)[:100],
-        }
+    check = await check_model_availability(api_url, api_key, model)
+    reachable = check["status"] in REACHABLE_STATUSES
+    error = check.get("error")
+    if check["status"] == "model_not_found":
+        error = f"Model '{model}' not found in available models"
+    return {
+        "reachable": reachable,
+        "model_available": check["status"] == "healthy",
+        "available_models": check.get("available_models", []) if reachable else [],
+        "error": error,
+    }
 
 
 # ============================================
@@ -210,22 +172,32 @@ async def get_embedder_status(current_user: CurrentUser) -> EmbedderStatusRespon
 # ============================================
 
 
+def _mask_providers(section: Any) -> Any:
+    """Return a copy of a config section with literal provider API keys masked.
+
+    Keys that reference environment variables (${VAR}) are shown as-is.
+    """
+    if not isinstance(section, dict) or not isinstance(section.get("providers"), dict):
+        return section
+
+    providers = {}
+    for name, provider in section["providers"].items():
+        if isinstance(provider, dict) and "api_key" in provider:
+            api_key = provider["api_key"]
+            if not (isinstance(api_key, str) and api_key.startswith("${")):
+                provider = {**provider, "api_key": "***"}
+        providers[name] = provider
+    return {**section, "providers": providers}
+
+
 @router.get("")
 async def get_full_config(current_user: CurrentUser) -> dict:
     """Get full configuration from config.yaml (masked)."""
     config = read_config()
 
     # Mask sensitive values
-    if "llm" in config and "providers" in config["llm"]:
-        for provider in config["llm"]["providers"].values():
-            if isinstance(provider, dict) and "api_key" in provider:
-                if not str(provider["api_key"]).startswith("${"):
-                    provider["api_key"] = "***"
-
-    if "embedder" in config and "providers" in config["embedder"]:
-        for provider in config["embedder"]["providers"].values():
-            if isinstance(provider, dict) and "api_key" in provider:
-                if not str(provider["api_key"]).startswith("${"):
-                    provider["api_key"] = "***"
+    for section in ("llm", "embedder"):
+        if section in config:
+            config = {**config, section: _mask_providers(config[section])}
 
     return {"config": config}
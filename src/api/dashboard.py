@@ -5,20 +5,43 @@
 
 """Dashboard API routes."""
 
+import asyncio
+import hashlib
 import os
 import re
+from functools import lru_cache
 from typing import Any
 
-from fastapi import APIRouter
-import httpx
+import orjson
+from fastapi import APIRouter, Request, Response
 
 from ..auth.dependencies import CurrentUser
 from ..config import get_settings
-from ..services.config_service import read_config
+from ..services.config_service import get_config_mtime_ns, read_config
 from ..services.graphiti_service import get_graphiti_client
+from ..services.model_check_service import check_model_availability
+from ..services.queue_service import get_queue_service
 
 router = APIRouter()
 
+# Cache policies for the polled endpoints. The queue is polled every 2 s, so
+# every poll revalidates (a 304 when unchanged); service status is polled
+# once a minute and may be reused for a few seconds.
+_QUEUE_CACHE_CONTROL = "private, no-cache"
+_STATUS_CACHE_CONTROL = "private, max-age=5, stale-if-error=60"
+
+# (config mtime, llm config, embedder config) of the last expansion
+_expanded_configs: tuple[int | None, dict[str, str], dict[str, str]] | None = None
+
+# ${VAR} or ${VAR:default}
+_ENV_VAR_RE = re.compile(r'\$\{([^}:]+)(?::([^}]*))?\}')
+
+
+@lru_cache(maxsize=256)
+def _env_get(name: str, default: str) -> str:
+    """Look up an environment variable (cached, env is fixed after startup)."""
+    return os.environ.get(name, default)
+
 
 def expand_env_vars(value: str) -> str:
     """Expand environment variables in a string.
@@ -28,14 +51,12 @@ def expand_env_vars(value: str) -> str:
     if not isinstance(value, str):
         return value
 
-    pattern = r'\$\{([^}:]+)(?::([^}]*))?\}'
-
     def replacer(match: re.Match) -> str:
         var_name = match.group(1)
         default = match.group(2) or ""
-        return os.environ.get(var_name, default)
+        return _env_get(var_name, default)
 
-    return re.sub(pattern, replacer, value)
+    return _ENV_VAR_RE.sub(replacer, value)
 
 
 def _get_provider_config(config: dict[str, Any], section: str) -> dict[str, str]:
@@ -68,6 +89,29 @@ def get_embedder_config(config: dict[str, Any]) -> dict[str, str]:
     return _get_provider_config(config, "embedder")
 
 
+def get_expanded_configs() -> tuple[dict[str, str], dict[str, str]]:
+    """Get expanded LLM and embedder configuration.
+
+    Cached until config.yaml changes; the returned dicts must not be modified.
+    """
+    global _expanded_configs
+    mtime_ns = get_config_mtime_ns()
+    if _expanded_configs is None or _expanded_configs[0] != mtime_ns:
+        config = read_config()
+        _expanded_configs = (mtime_ns, get_llm_config(config), get_embedder_config(config))
+    return _expanded_configs[1], _expanded_configs[2]
+
+
+def _etag_response(request: Request, content: dict[str, Any], cache_control: str) -> Response:
+    """Serialize a polled payload with an ETag, answering 304 if it is unchanged."""
+    body = orjson.dumps(content, option=orjson.OPT_SORT_KEYS)
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.get("/stats")
 async def get_dashboard_stats(current_user: CurrentUser) -> dict:
     """Get dashboard statistics using Graphiti (DB-neutral)."""
@@ -101,119 +145,37 @@ async def get_dashboard_stats(current_user: CurrentUser) -> dict:
         }
 
 
-async def check_model_availability(
-    api_url: str,
-    api_key: str,
-    model_name: str,
-) -> dict[str, Any]:
-    """Check if a model is available at the given API endpoint.
-
-    Returns dict with status, available models, and error message if any.
-    """
-    if not api_url:
-        return {"status": "unconfigured", "error": "API URL not configured"}
-
-    headers = {}
-    if api_key:
-        headers["Authorization"] = f"Bearer {api_key}"
-
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(f"{api_url}/models", headers=headers)
-
-            if response.status_code != 200:
-                return {
-                    "status": "error",
-                    "error": f"API returned {response.status_code}",
-                }
-
-            data = response.json()
-            models = data.get("data", [])
-            model_ids = [m.get("id", "") for m in models]
-
-            # Check if configured model exists
-            # Handle both exact match and prefix match (e.g., "llama3" vs "llama3:latest")
-            model_found = any(
-                model_name == mid or mid.startswith(f"{model_name}:")
-                for mid in model_ids
-            )
-
-            if model_found:
-                return {
-                    "status": "healthy",
-                    "model": model_name,
-                    "available_models": model_ids,
-                }
-            else:
-                return {
-                    "status": "model_not_found",
-                    "error": f"Model '{model_name}' not found",
-                    "configured_model": model_name,
-                    "available_models": model_ids,
-                }
-
-    except httpx.TimeoutException:
-        return {"status": "timeout", "error": "Connection timed out"}
-    except httpx.ConnectError:
-        return {"status": "unreachable", "error": "Could not connect to API"}
-    except Exception as e:
-        return {"status": "error", "error": str(e)}
-
-
 @router.get("/queue")
-async def get_queue_status(current_user: CurrentUser) -> dict:
+async def get_queue_status(request: Request, current_user: CurrentUser) -> Response:
     """Get queue status only (lightweight, for frequent polling)."""
-    from ..services.queue_service import get_queue_service
-
     try:
         queue_service = get_queue_service()
         status = await queue_service.get_status()
-        return {
+        result = {
             "total_pending": status.get("pending_count", 0),
             "currently_processing": 1 if status.get("processing", False) else 0,
         }
     except Exception as e:
-        return {
+        result = {
             "total_pending": 0,
             "currently_processing": 0,
             "error": str(e),
         }
+    return _etag_response(request, result, _QUEUE_CACHE_CONTROL)
 
 
-@router.get("/status")
-async def get_service_status(current_user: CurrentUser) -> dict:
-    """Get status of all services."""
-    settings = get_settings()
-    config = read_config()
-
-    # Check graph database via driver's health_check (DB-neutral)
-    from ..services.queue_service import get_queue_service
-
-    graphiti_status = "unknown"
+async def _graphiti_health_status() -> str:
+    """Check graph database via driver's health_check (DB-neutral)."""
     try:
         client = get_graphiti_client()
         health = await client.health_check()
-        graphiti_status = "healthy" if health.get("healthy") else "unreachable"
+        return "healthy" if health.get("healthy") else "unreachable"
     except Exception:
-        graphiti_status = "unreachable"
-
-    # Check LLM
-    llm_config = get_llm_config(config)
-    llm_check = await check_model_availability(
-        llm_config["api_url"],
-        llm_config["api_key"],
-        llm_config["model"],
-    )
+        return "unreachable"
 
-    # Check Embedder
-    embedder_config = get_embedder_config(config)
-    embedder_check = await check_model_availability(
-        embedder_config["api_url"],
-        embedder_config["api_key"],
-        embedder_config["model"],
-    )
 
-    # Check queue status via MCP
+async def _service_queue_status() -> dict[str, Any]:
+    """Check queue status via MCP."""
     queue_status = {"total_pending": 0, "currently_processing": 0, "error": None}
     try:
         queue_service = get_queue_service()
@@ -222,8 +184,32 @@ async def get_service_status(current_user: CurrentUser) -> dict:
         queue_status["currently_processing"] = 1 if status.get("processing", False) else 0
     except Exception as e:
         queue_status["error"] = str(e)
+    return queue_status
 
-    return {
+
+@router.get("/status")
+async def get_service_status(request: Request, current_user: CurrentUser) -> Response:
+    """Get status of all services."""
+    settings = get_settings()
+    llm_config, embedder_config = get_expanded_configs()
+
+    # The checks are independent, so run them concurrently
+    graphiti_status, llm_check, embedder_check, queue_status = await asyncio.gather(
+        _graphiti_health_status(),
+        check_model_availability(
+            llm_config["api_url"],
+            llm_config["api_key"],
+            llm_config["model"],
+        ),
+        check_model_availability(
+            embedder_config["api_url"],
+            embedder_config["api_key"],
+            embedder_config["model"],
+        ),
+        _service_queue_status(),
+    )
+
+    result = {
         "graphiti_mcp": {
             "status": graphiti_status,
             "url": settings.graphiti_mcp_url,
@@ -249,3 +235,4 @@ async def get_service_status(current_user: CurrentUser) -> dict:
         },
         "queue": queue_status,
     }
+    return _etag_response(request, result, _STATUS_CACHE_CONTROL)
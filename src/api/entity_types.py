@@ -6,11 +6,15 @@
 """Entity Types API routes - proxies to MCP server."""
 
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from ..auth.dependencies import CurrentUser
+from ..services.entity_type_service import EntityType as ServiceEntityType
 from ..services.entity_type_service import get_entity_type_service
+from .responses import ORJSONResponse
 
+# Routes returning entity types hand back a ready ORJSONResponse; response_model
+# is kept for the OpenAPI schema, but FastAPI skips re-validating the payload.
 router = APIRouter()
 
 
@@ -34,10 +38,40 @@ class EntityType(BaseModel):
     modified_at: str | None = Field(default=None, description="Last modification timestamp")
 
 
+# Dumps a whole list in one pass instead of one model_dump() per item
+_ENTITY_TYPE_LIST_ADAPTER = TypeAdapter(list[EntityType])
+
+
+def _to_api(et: ServiceEntityType) -> EntityType:
+    """Convert a service entity type to the API model.
+
+    The MCP server is the source of truth, so its records are not re-validated.
+    """
+    return EntityType.model_construct(
+        name=et.name,
+        description=et.description,
+        fields=[EntityTypeField.model_construct(**f) for f in et.fields],
+        source=et.source,
+        created_at=et.created_at,
+        modified_at=et.modified_at,
+    )
+
+
+# Entity type names: PascalCase, checked by pydantic-core's Rust regex engine
+# (a plain string pattern; a compiled re.Pattern would fall back to Python's re)
+_NAME_PATTERN = r"^[A-Z][a-zA-Z0-9]*$"
+_NAME_MAX_LENGTH = 64
+
+
 class EntityTypeCreate(BaseModel):
     """Create entity type request."""
 
-    name: str = Field(..., pattern=r"^[A-Z][a-zA-Z0-9]*$", description="PascalCase name")
+    name: str = Field(
+        ...,
+        pattern=_NAME_PATTERN,
+        max_length=_NAME_MAX_LENGTH,
+        description="PascalCase name",
+    )
     description: str = Field(..., min_length=10, description="Description for LLM extraction")
     fields: list[EntityTypeField] = Field(default_factory=list, description="Structured fields")
 
@@ -49,45 +83,29 @@ class EntityTypeUpdate(BaseModel):
     fields: list[EntityTypeField] | None = Field(default=None, description="Structured fields")
 
 
-@router.get("")
-async def list_entity_types(current_user: CurrentUser) -> list[EntityType]:
+@router.get("", response_model=list[EntityType])
+async def list_entity_types(current_user: CurrentUser) -> ORJSONResponse:
     """List all entity types from MCP server."""
     service = get_entity_type_service()
     entity_types = await service.get_all()
-    return [
-        EntityType(
-            name=et.name,
-            description=et.description,
-            fields=[EntityTypeField(**f) for f in et.fields],
-            source=et.source,
-            created_at=et.created_at,
-            modified_at=et.modified_at,
-        )
-        for et in entity_types
-    ]
+    result = [_to_api(et) for et in entity_types]
+    return ORJSONResponse(_ENTITY_TYPE_LIST_ADAPTER.dump_python(result))
 
 
 @router.post("", response_model=EntityType)
 async def create_entity_type(
     entity_type: EntityTypeCreate,
     current_user: CurrentUser,
-) -> EntityType:
+) -> ORJSONResponse:
     """Create a new entity type via MCP server."""
     service = get_entity_type_service()
     try:
         et = await service.create(
             name=entity_type.name,
             description=entity_type.description,
-            fields=[f.model_dump() for f in entity_type.fields],
-        )
-        return EntityType(
-            name=et.name,
-            description=et.description,
-            fields=[EntityTypeField(**f) for f in et.fields],
-            source=et.source,
-            created_at=et.created_at,
-            modified_at=et.modified_at,
+            fields=[dict(f) for f in entity_type.fields],
         )
+        return ORJSONResponse(_to_api(et).model_dump())
     except ValueError as e:
         raise HTTPException(status_code=409, detail=str(e))
 
@@ -108,20 +126,13 @@ async def reset_entity_types(current_user: CurrentUser) -> dict:
 
 
 @router.get("/{name}", response_model=EntityType)
-async def get_entity_type(name: str, current_user: CurrentUser) -> EntityType:
+async def get_entity_type(name: str, current_user: CurrentUser) -> ORJSONResponse:
     """Get a specific entity type from MCP server."""
     service = get_entity_type_service()
     et = await service.get_by_name(name)
     if not et:
         raise HTTPException(status_code=404, detail=f"Entity type '{name}' not found")
-    return EntityType(
-        name=et.name,
-        description=et.description,
-        fields=[EntityTypeField(**f) for f in et.fields],
-        source=et.source,
-        created_at=et.created_at,
-        modified_at=et.modified_at,
-    )
+    return ORJSONResponse(_to_api(et).model_dump())
 
 
 @router.put("/{name}", response_model=EntityType)
@@ -129,11 +140,11 @@ async def update_entity_type(
     name: str,
     update: EntityTypeUpdate,
     current_user: CurrentUser,
-) -> EntityType:
+) -> ORJSONResponse:
     """Update an entity type via MCP server."""
     service = get_entity_type_service()
 
-    fields = [f.model_dump() for f in update.fields] if update.fields else None
+    fields = [dict(f) for f in update.fields] if update.fields else None
     et = await service.update(
         name=name,
         description=update.description,
@@ -143,14 +154,7 @@ async def update_entity_type(
     if not et:
         raise HTTPException(status_code=404, detail=f"Entity type '{name}' not found")
 
-    return EntityType(
-        name=et.name,
-        description=et.description,
-        fields=[EntityTypeField(**f) for f in et.fields],
-        source=et.source,
-        created_at=et.created_at,
-        modified_at=et.modified_at,
-    )
+    return ORJSONResponse(_to_api(et).model_dump())
 
 
 @router.delete("/{name}")
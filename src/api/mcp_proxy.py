@@ -13,6 +13,7 @@ from fastapi import APIRouter, Request, Response, HTTPException, status
 
 from ..config import get_settings
 from ..services.api_key_service import validate_api_key
+from ..services.http_client import get_http_client
 
 router = APIRouter()
 
@@ -71,26 +72,27 @@ async def proxy_mcp(request: Request, path: str) -> Response:
     headers["Content-Type"] = request.headers.get("Content-Type", "application/json")
 
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.request(
-                method=request.method,
-                url=mcp_url,
-                content=body if body else None,
-                headers=headers,
-                params=dict(request.query_params),
-            )
-
-            # Return response with original status and headers
-            return Response(
-                content=response.content,
-                status_code=response.status_code,
-                headers={
-                    key: value
-                    for key, value in response.headers.items()
-                    if key.lower() not in ("transfer-encoding", "content-encoding")
-                },
-                media_type=response.headers.get("content-type", "application/json"),
-            )
+        client = get_http_client()
+        response = await client.request(
+            method=request.method,
+            url=mcp_url,
+            content=body if body else None,
+            headers=headers,
+            params=dict(request.query_params),
+            timeout=60.0,
+        )
+
+        # Return response with original status and headers
+        return Response(
+            content=response.content,
+            status_code=response.status_code,
+            headers={
+                key: value
+                for key, value in response.headers.items()
+                if key.lower() not in ("transfer-encoding", "content-encoding")
+            },
+            media_type=response.headers.get("content-type", "application/json"),
+        )
 
     except httpx.TimeoutException:
         raise HTTPException(
@@ -0,0 +1,18 @@
+# Graphiti UI — Admin interface for Graphiti Knowledge Graph
+# Copyright (c) 2026 Matthias Brusdeylins
+# SPDX-License-Identifier: MIT
+# 100% AI-generated code (vibe-coding with Claude)
+
+"""Shared response classes."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -67,6 +67,9 @@ class Settings(BaseSettings):
     # FalkorDB Browser (for external links)
     falkordb_browser_url: str = "http://localhost:3000"
 
+    # Status checks: seconds to cache LLM/embedder model availability
+    model_check_ttl: float = 30.0
+
     # Config file path (mounted volume)
     config_path: str = "/config/config.yaml"
 
@@ -84,21 +87,29 @@ class Settings(BaseSettings):
     # CORS (if needed)
     cors_origins: list[str] = ["*"]
 
+    # Secret key resolved from the secret file, memoized per instance
+    _resolved_secret_key: str = ""
+
     def get_secret_key(self) -> str:
         """Get or generate secret key."""
         if self.secret_key:
             return self.secret_key
+        if self._resolved_secret_key:
+            return self._resolved_secret_key
 
         # Auto-generate and persist secret key
         secret_file = Path(self.config_path).parent / ".secret_key"
         if secret_file.exists():
-            return secret_file.read_text().strip()
-
-        # Generate new secret key
-        new_key = secrets.token_hex(32)
-        secret_file.parent.mkdir(parents=True, exist_ok=True)
-        secret_file.write_text(new_key)
-        return new_key
+            key = secret_file.read_bytes().rstrip().decode()
+        else:
+            # Generate new secret key
+            key = secrets.token_hex(32)
+            if not secret_file.parent.exists():
+                secret_file.parent.mkdir(parents=True, exist_ok=True)
+            secret_file.write_text(key)
+
+        self._resolved_secret_key = key
+        return key
 
 
 @lru_cache
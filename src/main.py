@@ -15,6 +15,8 @@ from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 
 from .config import get_settings
+from .services.entity_type_service import get_entity_type_service
+from .services.http_client import close_http_client
 
 # Import routers
 from .api import router as api_router
@@ -29,8 +31,12 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     print(f"Starting {settings.app_name}...")
     print(f"Graphiti MCP URL: {settings.graphiti_mcp_url}")
     print(f"Config Path: {settings.config_path}")
+    # Load entity types in the background so the first page view hits a warm cache
+    get_entity_type_service().warm()
     yield
     print("Shutting down...")
+    await get_entity_type_service().close()
+    await close_http_client()
 
 
 def create_app() -> FastAPI:
@@ -8,6 +8,7 @@
 Handles reading/writing of config.yaml
 """
 
+import copy
 from pathlib import Path
 from typing import Any
 
@@ -15,6 +16,15 @@ import yaml
 
 from ..config import get_settings
 
+# Use the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# (st_mtime_ns, parsed config) of the last read
+_config_cache: tuple[int, dict[str, Any]] | None = None
+
 
 def get_config_path() -> Path:
     """Get path to config file."""
@@ -22,21 +32,38 @@ def get_config_path() -> Path:
     return Path(settings.config_path)
 
 
+def get_config_mtime_ns() -> int | None:
+    """Get the config file's modification time in ns, or None if it is missing."""
+    try:
+        return get_config_path().stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
 def read_config() -> dict[str, Any]:
-    """Read configuration from YAML file."""
-    config_path = get_config_path()
+    """Read configuration from YAML file.
 
-    if not config_path.exists():
+    The parsed file is cached until its mtime changes. Callers get a deep copy
+    they are free to modify.
+    """
+    global _config_cache
+    mtime_ns = get_config_mtime_ns()
+    if mtime_ns is None:
         return {}
 
-    with open(config_path) as f:
-        return yaml.safe_load(f) or {}
+    if _config_cache is None or _config_cache[0] != mtime_ns:
+        with open(get_config_path()) as f:
+            _config_cache = (mtime_ns, yaml.load(f, Loader=_SafeLoader) or {})
+
+    return copy.deepcopy(_config_cache[1])
 
 
 def write_config(config: dict[str, Any]) -> None:
     """Write configuration to YAML file."""
+    global _config_cache
     config_path = get_config_path()
     config_path.parent.mkdir(parents=True, exist_ok=True)
 
     with open(config_path, "w") as f:
         yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+    _config_cache = None
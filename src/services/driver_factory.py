@@ -9,6 +9,7 @@ Reads graph_provider from config and creates the appropriate driver.
 """
 
 import logging
+from collections.abc import Callable
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -19,6 +20,59 @@ from ..config import Settings
 logger = logging.getLogger(__name__)
 
 
+def _build_falkor(settings: Settings) -> "GraphDriver":
+    from graphiti_core.driver.falkordb_driver import FalkorDriver
+
+    logger.info(f"Creating FalkorDriver: {settings.falkordb_host}:{settings.falkordb_port}")
+    return FalkorDriver(
+        host=settings.falkordb_host,
+        port=settings.falkordb_port,
+        password=settings.falkordb_password or None,
+        database=settings.falkordb_database,
+    )
+
+
+def _build_neo4j(settings: Settings) -> "GraphDriver":
+    from graphiti_core.driver.neo4j_driver import Neo4jDriver
+
+    logger.info(f"Creating Neo4jDriver: {settings.neo4j_uri}")
+    return Neo4jDriver(
+        uri=settings.neo4j_uri,
+        user=settings.neo4j_user or None,
+        password=settings.neo4j_password or None,
+        database=settings.neo4j_database,
+    )
+
+
+def _build_kuzu(settings: Settings) -> "GraphDriver":
+    from graphiti_core.driver.kuzu_driver import KuzuDriver
+
+    logger.info(f"Creating KuzuDriver: {settings.kuzu_db_path}")
+    return KuzuDriver(db=settings.kuzu_db_path)
+
+
+def _build_neptune(settings: Settings) -> "GraphDriver":
+    from graphiti_core.driver.neptune_driver import NeptuneDriver
+
+    logger.info(f"Creating NeptuneDriver: {settings.neptune_host}")
+    return NeptuneDriver(
+        host=settings.neptune_host,
+        port=settings.neptune_port,
+        aoss_host=settings.neptune_aoss_host,
+        aoss_port=settings.neptune_aoss_port,
+    )
+
+
+# Provider name -> driver builder. Each builder imports its driver lazily,
+# so only the configured provider's dependencies are loaded.
+_BUILDERS: dict[str, Callable[[Settings], "GraphDriver"]] = {
+    "falkordb": _build_falkor,
+    "neo4j": _build_neo4j,
+    "kuzu": _build_kuzu,
+    "neptune": _build_neptune,
+}
+
+
 def create_driver(settings: Settings) -> "GraphDriver":
     """Create a GraphDriver based on config settings.
 
@@ -33,47 +87,12 @@ def create_driver(settings: Settings) -> "GraphDriver":
     """
     provider = settings.graph_provider.lower()
 
-    if provider == "falkordb":
-        from graphiti_core.driver.falkordb_driver import FalkorDriver
-
-        logger.info(f"Creating FalkorDriver: {settings.falkordb_host}:{settings.falkordb_port}")
-        return FalkorDriver(
-            host=settings.falkordb_host,
-            port=settings.falkordb_port,
-            password=settings.falkordb_password or None,
-            database=settings.falkordb_database,
-        )
-
-    elif provider == "neo4j":
-        from graphiti_core.driver.neo4j_driver import Neo4jDriver
-
-        logger.info(f"Creating Neo4jDriver: {settings.neo4j_uri}")
-        return Neo4jDriver(
-            uri=settings.neo4j_uri,
-            user=settings.neo4j_user or None,
-            password=settings.neo4j_password or None,
-            database=settings.neo4j_database,
-        )
-
-    elif provider == "kuzu":
-        from graphiti_core.driver.kuzu_driver import KuzuDriver
-
-        logger.info(f"Creating KuzuDriver: {settings.kuzu_db_path}")
-        return KuzuDriver(db=settings.kuzu_db_path)
-
-    elif provider == "neptune":
-        from graphiti_core.driver.neptune_driver import NeptuneDriver
-
-        logger.info(f"Creating NeptuneDriver: {settings.neptune_host}")
-        return NeptuneDriver(
-            host=settings.neptune_host,
-            port=settings.neptune_port,
-            aoss_host=settings.neptune_aoss_host,
-            aoss_port=settings.neptune_aoss_port,
-        )
-
-    else:
+    try:
+        builder = _BUILDERS[provider]
+    except KeyError:
         raise ValueError(
             f"Unsupported graph_provider: {provider}. "
-            f"Supported: falkordb, neo4j, kuzu, neptune"
-        )
+            f"Supported: {', '.join(_BUILDERS)}"
+        ) from None
+
+    return builder(settings)
@@ -9,19 +9,30 @@ All entity type management is delegated to the MCP server which stores
 entity types in a JSON file. This makes the UI database-neutral.
 """
 
+import asyncio
 import logging
-from typing import Any
+import time
+from typing import Any, TypeGuard, TypeVar
 
 import httpx
+import orjson
 
 from ..config import get_settings
+from .http_client import HTTP_TIMEOUTS
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# MCP bodies are encoded and decoded with orjson; requests are sent as raw content
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class EntityType:
     """Entity type model."""
 
+    __slots__ = ("name", "description", "fields", "source", "created_at", "modified_at")
+
     def __init__(
         self,
         name: str,
@@ -64,37 +75,111 @@ class EntityTypeService:
     """Service for managing entity types via MCP HTTP endpoints."""
 
     def __init__(self):
-        self._mcp_url: str | None = None
+        self._mcp_url = get_settings().graphiti_mcp_url
+        self._client: httpx.AsyncClient | None = None
+
+        # Short-lived cache of reads, dropped on every write through this service
+        self._cache_ttl = 30.0
+        self._all_cache: tuple[float, list[EntityType]] | None = None
+        self._name_cache: dict[str, tuple[float, EntityType]] = {}
+        self._cache_generation = 0
+        self._refresh_task: asyncio.Task[list[EntityType]] | None = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get or create the HTTP client for the MCP server."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self._mcp_url,
+                http2=True,
+                timeout=HTTP_TIMEOUTS["mcp"],
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            )
+        return self._client
+
+    async def _request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """Send a request to the MCP server's entity type endpoints."""
+        return await self._get_client().request(method, path, **kwargs)
+
+    def _is_fresh(self, cached: tuple[float, _T] | None) -> TypeGuard[tuple[float, _T]]:
+        """Check whether a cache entry is younger than the TTL."""
+        return cached is not None and time.monotonic() - cached[0] < self._cache_ttl
 
-    @property
-    def mcp_url(self) -> str:
-        """Get the MCP server URL."""
-        if self._mcp_url is None:
-            settings = get_settings()
-            self._mcp_url = settings.graphiti_mcp_url
-        return self._mcp_url
+    def _invalidate_cache(self) -> None:
+        """Drop cached reads (and any refill still in flight) after a write."""
+        self._all_cache = None
+        self._name_cache.clear()
+        self._cache_generation += 1
+        # Later readers must not join a fetch that started before the write
+        self._refresh_task = None
+
+    async def _refresh_all(self) -> list[EntityType]:
+        """Fetch all entity types and store them in the cache."""
+        generation = self._cache_generation
+        response = await self._request("GET", "/entity-types")
+        response.raise_for_status()
+        entity_types = [EntityType.from_dict(t) for t in orjson.loads(response.content)]
+
+        if generation == self._cache_generation:
+            self._all_cache = (time.monotonic(), entity_types)
+        return entity_types
+
+    def _start_refresh(self) -> asyncio.Task[list[EntityType]]:
+        """Start a cache refill, or return the one already in flight."""
+        task = self._refresh_task
+        if task is None:
+            task = asyncio.create_task(self._refresh_all())
+            self._refresh_task = task
+            task.add_done_callback(self._refresh_done)
+        return task
+
+    def _refresh_done(self, task: asyncio.Task[list[EntityType]]) -> None:
+        """Clear the finished refill and log its failure (also for unawaited refills)."""
+        if self._refresh_task is task:
+            self._refresh_task = None
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Error getting entity types from MCP: {task.exception()}")
+
+    def warm(self) -> None:
+        """Fill the cache in the background, e.g. on startup."""
+        self._start_refresh()
 
     async def get_all(self) -> list[EntityType]:
-        """Get all entity types from MCP server."""
+        """Get all entity types from MCP server (cached for a short TTL).
+
+        Once the TTL has passed, the previous list is returned while a
+        refill runs in the background; only a cold cache waits for the
+        MCP server. Concurrent callers share a single refill.
+        """
+        cached = self._all_cache
+        if self._is_fresh(cached):
+            return cached[1]
+
+        task = self._start_refresh()
+        if cached is not None:
+            return cached[1]
+
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(f"{self.mcp_url}/entity-types")
-                response.raise_for_status()
-                data = response.json()
-                return [EntityType.from_dict(t) for t in data]
-        except Exception as e:
-            logger.error(f"Error getting entity types from MCP: {e}")
+            # Shield so a cancelled caller does not cancel the refill other callers await
+            return await asyncio.shield(task)
+        except Exception:
+            # Already logged by _refresh_done
             return []
 
     async def get_by_name(self, name: str) -> EntityType | None:
-        """Get entity type by name from MCP server."""
+        """Get entity type by name from MCP server (cached for a short TTL)."""
+        if self._is_fresh(self._all_cache):
+            return next((et for et in self._all_cache[1] if et.name == name), None)
+        cached = self._name_cache.get(name)
+        if self._is_fresh(cached):
+            return cached[1]
+
+        generation = self._cache_generation
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(f"{self.mcp_url}/entity-types/{name}")
-                if response.status_code == 404:
-                    return None
-                response.raise_for_status()
-                return EntityType.from_dict(response.json())
+            response = await self._request("GET", f"/entity-types/{name}")
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+            entity_type = EntityType.from_dict(orjson.loads(response.content))
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 return None
@@ -104,6 +189,10 @@ class EntityTypeService:
             logger.error(f"Error getting entity type {name} from MCP: {e}")
             return None
 
+        if generation == self._cache_generation:
+            self._name_cache[name] = (time.monotonic(), entity_type)
+        return entity_type
+
     async def create(
         self,
         name: str,
@@ -111,20 +200,22 @@ class EntityTypeService:
         fields: list[dict[str, Any]] | None = None,
     ) -> EntityType:
         """Create a new entity type via MCP server."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{self.mcp_url}/entity-types",
-                json={
-                    "name": name,
-                    "description": description,
-                    "fields": fields or [],
-                },
-            )
-            if response.status_code == 409:
-                raise ValueError(f"Entity type '{name}' already exists")
-            response.raise_for_status()
-            logger.info(f"Created entity type via MCP: {name}")
-            return EntityType.from_dict(response.json())
+        response = await self._request(
+            "POST",
+            "/entity-types",
+            content=orjson.dumps({
+                "name": name,
+                "description": description,
+                "fields": fields or [],
+            }),
+            headers=_JSON_HEADERS,
+        )
+        self._invalidate_cache()
+        if response.status_code == 409:
+            raise ValueError(f"Entity type '{name}' already exists")
+        response.raise_for_status()
+        logger.info(f"Created entity type via MCP: {name}")
+        return EntityType.from_dict(orjson.loads(response.content))
 
     async def update(
         self,
@@ -140,16 +231,18 @@ class EntityTypeService:
             if fields is not None:
                 payload["fields"] = fields
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.put(
-                    f"{self.mcp_url}/entity-types/{name}",
-                    json=payload,
-                )
-                if response.status_code == 404:
-                    return None
-                response.raise_for_status()
-                logger.info(f"Updated entity type via MCP: {name}")
-                return EntityType.from_dict(response.json())
+            response = await self._request(
+                "PUT",
+                f"/entity-types/{name}",
+                content=orjson.dumps(payload),
+                headers=_JSON_HEADERS,
+            )
+            self._invalidate_cache()
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+            logger.info(f"Updated entity type via MCP: {name}")
+            return EntityType.from_dict(orjson.loads(response.content))
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 return None
@@ -161,13 +254,13 @@ class EntityTypeService:
     async def delete(self, name: str) -> bool:
         """Delete an entity type via MCP server."""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.delete(f"{self.mcp_url}/entity-types/{name}")
-                if response.status_code == 404:
-                    return False
-                response.raise_for_status()
-                logger.info(f"Deleted entity type via MCP: {name}")
-                return True
+            response = await self._request("DELETE", f"/entity-types/{name}")
+            self._invalidate_cache()
+            if response.status_code == 404:
+                return False
+            response.raise_for_status()
+            logger.info(f"Deleted entity type via MCP: {name}")
+            return True
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
                 return False
@@ -178,18 +271,31 @@ class EntityTypeService:
 
     async def reset_to_defaults(self) -> list[EntityType]:
         """Reset entity types to defaults via MCP server."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(f"{self.mcp_url}/entity-types/reset")
-            response.raise_for_status()
-            result = response.json()
-            logger.info(f"Reset entity types via MCP: {result.get('count', 0)} types")
+        response = await self._request("POST", "/entity-types/reset")
+        self._invalidate_cache()
+        response.raise_for_status()
+        result = orjson.loads(response.content)
+
+        # Servers that return the reset list save a second round trip
+        if isinstance(result, list):
+            entity_types = [EntityType.from_dict(t) for t in result]
+            self._all_cache = (time.monotonic(), entity_types)
+            logger.info(f"Reset entity types via MCP: {len(entity_types)} types")
+            return entity_types
+
+        logger.info(f"Reset entity types via MCP: {result.get('count', 0)} types")
 
-            # Fetch the updated list
-            return await self.get_all()
+        # Older servers only return a count, fetch the updated list
+        return await self.get_all()
 
-    async def close(self):
-        """Close the service (no-op for HTTP client)."""
-        pass
+    async def close(self) -> None:
+        """Close HTTP client."""
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        if self._client:
+            await self._client.aclose()
+            self._client = None
 
 
 # Singleton instance
@@ -11,7 +11,6 @@ Uses the Graphiti class facade for CRUD operations with auto-embedding generatio
 import logging
 from typing import Any
 
-import httpx
 from graphiti_core import Graphiti
 from graphiti_core.driver.driver import GraphDriver
 from graphiti_core.embedder import OpenAIEmbedder, OpenAIEmbedderConfig
@@ -19,6 +18,7 @@ from graphiti_core.errors import EdgeNotFoundError, NodeNotFoundError
 
 from ..config import get_settings
 from .driver_factory import create_driver
+from .http_client import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -83,11 +83,11 @@ class GraphitiClient:
     async def health_check(self) -> dict:
         """Check if MCP server (and its DB connection) is healthy."""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.settings.graphiti_mcp_url}/health")
-                response.raise_for_status()
-                data = response.json()
-                return {"healthy": True, "data": data}
+            client = get_http_client()
+            response = await client.get(f"{self.settings.graphiti_mcp_url}/health", timeout=10.0)
+            response.raise_for_status()
+            data = response.json()
+            return {"healthy": True, "data": data}
         except Exception as e:
             return {"healthy": False, "error": str(e)}
 
@@ -584,52 +584,52 @@ class GraphitiClient:
             return None
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                # Step 1: Initialize MCP session
-                init_payload = {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "initialize",
-                    "params": {
-                        "protocolVersion": "2024-11-05",
-                        "capabilities": {},
-                        "clientInfo": {"name": "graphiti-ui", "version": "1.0"},
-                    },
-                }
-                init_response = await client.post(
-                    mcp_url, json=init_payload, headers=mcp_headers
-                )
-                if init_response.status_code != 200:
-                    return {"success": False, "error": f"MCP init failed: HTTP {init_response.status_code}"}
-
-                session_id = init_response.headers.get("mcp-session-id")
-                if not session_id:
-                    return {"success": False, "error": "MCP server did not return session ID"}
-
-                # Step 2: Call the tool with session ID
-                tool_payload = {
-                    "jsonrpc": "2.0",
-                    "id": 2,
-                    "method": "tools/call",
-                    "params": {
-                        "name": tool_name,
-                        "arguments": arguments,
-                    },
-                }
-                tool_headers = {**mcp_headers, "mcp-session-id": session_id}
-                response = await client.post(
-                    mcp_url, json=tool_payload, headers=tool_headers
-                )
-
-                if response.status_code == 200:
-                    # Parse SSE response
-                    result = parse_sse_response(response.text)
-                    if result is None:
-                        return {"success": False, "error": "Failed to parse MCP response"}
-                    if "error" in result:
-                        return {"success": False, "error": result["error"]}
-                    return {"success": True, "data": result.get("result", {})}
-                return {"success": False, "error": f"HTTP {response.status_code}"}
+            client = get_http_client()
+            # Step 1: Initialize MCP session
+            init_payload = {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "initialize",
+                "params": {
+                    "protocolVersion": "2024-11-05",
+                    "capabilities": {},
+                    "clientInfo": {"name": "graphiti-ui", "version": "1.0"},
+                },
+            }
+            init_response = await client.post(
+                mcp_url, json=init_payload, headers=mcp_headers, timeout=60.0
+            )
+            if init_response.status_code != 200:
+                return {"success": False, "error": f"MCP init failed: HTTP {init_response.status_code}"}
+
+            session_id = init_response.headers.get("mcp-session-id")
+            if not session_id:
+                return {"success": False, "error": "MCP server did not return session ID"}
+
+            # Step 2: Call the tool with session ID
+            tool_payload = {
+                "jsonrpc": "2.0",
+                "id": 2,
+                "method": "tools/call",
+                "params": {
+                    "name": tool_name,
+                    "arguments": arguments,
+                },
+            }
+            tool_headers = {**mcp_headers, "mcp-session-id": session_id}
+            response = await client.post(
+                mcp_url, json=tool_payload, headers=tool_headers, timeout=60.0
+            )
+
+            if response.status_code == 200:
+                # Parse SSE response
+                result = parse_sse_response(response.text)
+                if result is None:
+                    return {"success": False, "error": "Failed to parse MCP response"}
+                if "error" in result:
+                    return {"success": False, "error": result["error"]}
+                return {"success": True, "data": result.get("result", {})}
+            return {"success": False, "error": f"HTTP {response.status_code}"}
 
         except Exception as e:
             return {"success": False, "error": str(e)}
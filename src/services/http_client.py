@@ -0,0 +1,53 @@
+# Graphiti UI — Admin interface for Graphiti Knowledge Graph
+# Copyright (c) 2026 Matthias Brusdeylins
+# SPDX-License-Identifier: MIT
+# 100% AI-generated code (vibe-coding with Claude)
+
+"""Shared HTTP client.
+
+A single long-lived httpx.AsyncClient reused by all outbound requests, so
+connections (and TLS sessions) are pooled instead of being re-established
+on every call. HTTP/2 is negotiated with servers that offer it (over TLS), so
+concurrent requests to one host share a single multiplexed connection.
+Created on startup and closed on shutdown via the app lifespan.
+"""
+
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+
+import httpx
+
+# Per-upstream timeouts. Connect timeouts stay short so an unreachable
+# service fails fast instead of holding a pool slot for the full read timeout.
+HTTP_TIMEOUTS: dict[str, httpx.Timeout] = {
+    "mcp": httpx.Timeout(connect=1.0, read=10.0, write=5.0, pool=2.0),
+    "llm_probe": httpx.Timeout(connect=2.0, read=8.0, write=5.0, pool=2.0),
+}
+
+# Singleton instance
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared AsyncClient singleton."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            # Shared across users (e.g. the MCP proxy), so never keep response cookies
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+            timeout=httpx.Timeout(10.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=40,
+                max_connections=100,
+                keepalive_expiry=30,
+            ),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared AsyncClient."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
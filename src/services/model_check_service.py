@@ -0,0 +1,194 @@
+# Graphiti UI — Admin interface for Graphiti Knowledge Graph
+# Copyright (c) 2026 Matthias Brusdeylins
+# SPDX-License-Identifier: MIT
+# 100% AI-generated code (vibe-coding with Claude)
+
+"""Model availability checks.
+
+Probes the OpenAI-compatible /models endpoint of the LLM and embedder APIs.
+Results are cached in-process for a short TTL so a polling dashboard does not
+hit the upstream APIs on every request, and concurrent checks of the same
+endpoint share a single in-flight request. Caching is per endpoint rather
+than per model, so an LLM and embedder served by the same API cost one
+request. An API that keeps failing is not probed again until a cool-down has
+passed, so the dashboard does not wait for a timeout on every poll during an
+outage.
+"""
+
+import asyncio
+import time
+from typing import Any, TypedDict
+
+import httpx
+
+from ..config import get_settings
+from .http_client import HTTP_TIMEOUTS, get_http_client
+
+# Statuses that mean the API answered
+REACHABLE_STATUSES = ("healthy", "model_not_found")
+
+# (api_url, api_key) -> (time.monotonic() of the fetch, model ids)
+_MODEL_CHECK_CACHE: dict[tuple[str, str], tuple[float, list[str]]] = {}
+
+# (api_url, api_key) -> fetch currently running for that endpoint
+_INFLIGHT: dict[tuple[str, str], asyncio.Task[dict[str, Any]]] = {}
+
+# Seconds past the TTL a cached list may still be served while fetches fail
+STALE_IF_ERROR = 60.0
+
+# Circuit breaker: consecutive failures before an API is skipped, and for how long
+BREAKER_THRESHOLD = 3
+BREAKER_COOLDOWN = 30.0
+
+
+class _BreakerState(TypedDict):
+    """Circuit breaker state of one API."""
+
+    fails: int
+    open_until: float
+    last_failure: dict[str, Any]
+
+
+# api_url -> breaker state
+_BREAKER: dict[str, _BreakerState] = {}
+
+
+async def _fetch_models(api_url: str, api_key: str) -> dict[str, Any]:
+    """Query the /models endpoint.
+
+    Returns {"status": "ok", "model_ids": [...]} or a dict with a failure
+    status and error message.
+    """
+    headers = {}
+    if api_key:
+        headers["Authorization"] = f"Bearer {api_key}"
+
+    try:
+        client = get_http_client()
+        response = await client.get(
+            f"{api_url}/models", headers=headers, timeout=HTTP_TIMEOUTS["llm_probe"]
+        )
+
+        if response.status_code != 200:
+            return {
+                "status": "error",
+                "error": f"API returned {response.status_code}",
+            }
+
+        data = response.json()
+        models = data.get("data", [])
+        return {"status": "ok", "model_ids": [m.get("id", "") for m in models]}
+
+    except httpx.TimeoutException:
+        return {"status": "timeout", "error": "Connection timed out"}
+    except httpx.ConnectError:
+        return {"status": "unreachable", "error": "Could not connect to API"}
+    except Exception as e:
+        return {"status": "error", "error": str(e)}
+
+
+def _record_fetch(api_url: str, result: dict[str, Any]) -> None:
+    """Update the circuit breaker for an API with the outcome of a fetch."""
+    if result["status"] == "ok":
+        _BREAKER.pop(api_url, None)
+        return
+
+    breaker = _BREAKER.setdefault(api_url, {"fails": 0, "open_until": 0.0, "last_failure": result})
+    breaker["fails"] += 1
+    breaker["last_failure"] = result
+    if breaker["fails"] >= BREAKER_THRESHOLD:
+        breaker["open_until"] = time.monotonic() + BREAKER_COOLDOWN
+
+
+async def _refresh(
+    key: tuple[str, str],
+    cached: tuple[float, list[str]] | None,
+) -> dict[str, Any]:
+    """Fetch the model list and update the cache, falling back to a stale list on failure."""
+    api_url = key[0]
+    breaker = _BREAKER.get(api_url)
+    if breaker and time.monotonic() < breaker["open_until"]:
+        # Circuit open: report the last failure without touching the network
+        result = breaker["last_failure"]
+    else:
+        result = await _fetch_models(*key)
+        _record_fetch(api_url, result)
+
+    if result["status"] == "ok":
+        _MODEL_CHECK_CACHE[key] = (time.monotonic(), result["model_ids"])
+        return result
+
+    if cached:
+        if time.monotonic() - cached[0] < get_settings().model_check_ttl + STALE_IF_ERROR:
+            return {
+                "status": "ok",
+                "model_ids": cached[1],
+                "error": f"Stale result, last check failed: {result['error']}",
+            }
+        # Too old to stand in for a working API: report the real failure
+        if _MODEL_CHECK_CACHE.get(key) is cached:
+            del _MODEL_CHECK_CACHE[key]
+    return result
+
+
+async def _get_models(api_url: str, api_key: str) -> dict[str, Any]:
+    """Get the model list of an endpoint from the cache or a (shared) fetch."""
+    key = (api_url, api_key)
+    cached = _MODEL_CHECK_CACHE.get(key)
+    if cached and time.monotonic() - cached[0] < get_settings().model_check_ttl:
+        return {"status": "ok", "model_ids": cached[1]}
+
+    # Join a fetch that is already running for this endpoint instead of starting another
+    task = _INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.create_task(_refresh(key, cached))
+        _INFLIGHT[key] = task
+        task.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+
+    # Shield so a cancelled caller does not cancel the fetch other callers await
+    return await asyncio.shield(task)
+
+
+async def check_model_availability(
+    api_url: str,
+    api_key: str,
+    model_name: str,
+) -> dict[str, Any]:
+    """Check if a model is available at the given API endpoint.
+
+    Returns dict with status, available models, and error message if any.
+    Model lists are cached for ``model_check_ttl`` seconds. If a fetch fails
+    within ``STALE_IF_ERROR`` seconds after that, the stale list is used and
+    the failure is noted in ``error``, so a short upstream outage does not
+    blank the UI; a longer outage reports the failure itself.
+    """
+    if not api_url:
+        return {"status": "unconfigured", "error": "API URL not configured"}
+
+    listing = await _get_models(api_url, api_key)
+    if listing["status"] != "ok":
+        return listing
+
+    model_ids = listing["model_ids"]
+
+    # Check if configured model exists: exact match first (a C-level scan),
+    # prefix match (e.g., "llama3" vs "llama3:latest") only if that fails
+    prefix = f"{model_name}:"
+    model_found = model_name in model_ids or any(mid.startswith(prefix) for mid in model_ids)
+
+    if model_found:
+        result = {
+            "status": "healthy",
+            "model": model_name,
+            "available_models": model_ids,
+        }
+        if "error" in listing:
+            result["error"] = listing["error"]
+        return result
+    else:
+        return {
+            "status": "model_not_found",
+            "error": f"Model '{model_name}' not found",
+            "configured_model": model_name,
+            "available_models": model_ids,
+        }
@@ -21,6 +21,7 @@ class QueueService:
     """Service for monitoring queue status via MCP server."""
 
     def __init__(self):
+        self._status_url = f"{get_settings().graphiti_mcp_url}/queue/status"
         self._client: httpx.AsyncClient | None = None
 
     def _get_client(self) -> httpx.AsyncClient:
@@ -38,10 +39,9 @@ class QueueService:
             - currently_processing: int - number of active workers
         """
         try:
-            settings = get_settings()
             client = self._get_client()
 
-            response = await client.get(f"{settings.graphiti_mcp_url}/queue/status")
+            response = await client.get(self._status_url)
             response.raise_for_status()
 
             data = response.json()